@@ -2,11 +2,14 @@
 # Quote Comparison Chatbot – Final Polished Version (with clean AI output)
 # ==============================================================
 
+import hashlib
+import io
+import json
 import os
 import re
-from dataclasses import asdict
+from dataclasses import astuple, fields
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
@@ -14,7 +17,7 @@ from openai import OpenAI, OpenAIError
 
 from core.models import Quote
 from core.parser import read_uploaded_file, read_quotes_from_df
-from core.pdf_extractor import extract_quotes_from_pdfs
+from core.pdf_extractor import extract_quotes_from_payloads
 from core.scoring import score_quotes
 from utils.logger import get_logger
 
@@ -60,6 +63,41 @@ with st.sidebar:
         "network": w_net / total,
     }
 
+# ==============================================================
+# Cached heavy lifting
+# ==============================================================
+# Streamlit reruns the whole script on every widget change; these wrappers
+# key the expensive work on file bytes / parameter tuples so tweaking a
+# slider never re-runs OCR or re-parses an unchanged upload.
+@st.cache_data(show_spinner=False)
+def _cached_extract(files_bytes: Tuple[Tuple[str, bytes], ...]) -> List[Quote]:
+    return extract_quotes_from_payloads(list(files_bytes))
+
+
+@st.cache_data(show_spinner=False)
+def _cached_read(name: str, data: bytes) -> List[Quote]:
+    buf = io.BytesIO(data)
+    buf.name = name
+    return read_uploaded_file(buf)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_score(quotes_tuple, expected_claims: int, avg_claim: float,
+                  weights_tuple) -> pd.DataFrame:
+    quotes = [Quote(*t) for t in quotes_tuple]
+    return score_quotes(quotes, expected_claims, avg_claim, dict(weights_tuple))
+
+
+_QUOTE_FIELDS = [f.name for f in fields(Quote)]
+
+
+@st.cache_data(show_spinner=False,
+               hash_funcs={Quote: lambda q: tuple(getattr(q, n) for n in _QUOTE_FIELDS)})
+def _quotes_display_df(quotes: List[Quote]) -> pd.DataFrame:
+    # Columnar build: no per-quote dict allocation or asdict deep copy
+    return pd.DataFrame({name: [getattr(q, name) for q in quotes] for name in _QUOTE_FIELDS})
+
+
 # ==============================================================
 # Upload Section
 # ==============================================================
@@ -73,7 +111,7 @@ if uploaded_files:
 
     if pdfs:
         with st.spinner("🔍 Extracting data from PDFs..."):
-            pdf_quotes = extract_quotes_from_pdfs(pdfs)
+            pdf_quotes = _cached_extract(tuple((f.name, f.getvalue()) for f in pdfs))
             if pdf_quotes:
                 quotes.extend(pdf_quotes)
                 st.success(f"Extracted {len(pdf_quotes)} quote(s) from PDFs.")
@@ -82,7 +120,7 @@ if uploaded_files:
 
     for f in others:
         try:
-            quotes.extend(read_uploaded_file(f))
+            quotes.extend(_cached_read(f.name, f.getvalue()))
         except Exception as e:
             st.error(f"Error reading {f.name}: {e}")
 
@@ -91,7 +129,7 @@ if uploaded_files:
 # ==============================================================
 if quotes:
     st.subheader("📋 Quotes Loaded")
-    st.dataframe(pd.DataFrame([asdict(q) for q in quotes]), use_container_width=True)
+    st.dataframe(_quotes_display_df(quotes), use_container_width=True)
 else:
     st.info("Upload or enter at least one quote to begin.")
 
@@ -130,23 +168,10 @@ def build_local_summary(df: pd.DataFrame, region: str, income: str, family_size:
 # ==============================================================
 # Ask OpenAI with Structured Markdown Output
 # ==============================================================
-def ask_openai_context(df: pd.DataFrame, question: str, region: str, income_level: str, family_size: int) -> str:
-    """Ask OpenAI model with structured reasoning and consistent formatting."""
-    if not client:
-        return build_local_summary(df, region, income_level, family_size)
-
-    try:
-        context = df.to_dict(orient="records")
-        prompt = f"""
-You are a senior health insurance advisor. Analyze the following insurance quotes and recommend ONE best plan.
-
-### CONTEXT
-Region: {region}
-Family size: {family_size}
-Income level: {income_level}
-
-### PLANS DATA
-{context}
+# Static instructions live in a byte-identical system message so provider-side
+# prefix caching can reuse its prefill across calls; only the user message
+# (profile, plans, question) varies per request.
+STATIC_SYSTEM = """You are a senior health insurance advisor. Analyze the provided insurance quotes and recommend ONE best plan.
 
 ### INSTRUCTIONS
 1. Interpret coinsurance correctly:
@@ -169,33 +194,144 @@ Income level: {income_level}
 - Reason 4
 
 ### 💡 Summary
-One short paragraph summarizing why this plan is ideal for this family context.
-"""
+One short paragraph summarizing why this plan is ideal for this family context."""
 
-        response = client.chat.completions.create(
+
+def ask_openai_context(df: pd.DataFrame, question: str, region: str, income_level: str, family_size: int) -> str:
+    """Ask OpenAI, render the answer, and return the collected text.
+
+    The answer streams token-by-token via st.write_stream so the first words
+    appear in ~hundreds of ms instead of after the full completion. Answers
+    are memoized per prompt in session state, so re-asking an unchanged
+    question over unchanged quotes skips the network call entirely.
+    """
+    if not client:
+        text = build_local_summary(df, region, income_level, family_size)
+        st.markdown(text)
+        return text
+
+    context = df.to_dict(orient="records")
+    # Stable-ish profile first, fully variable plans/question last, so the
+    # shared prefix stays maximal across calls in a session
+    profile_block = f"Region: {region}\nFamily size: {family_size}\nIncome level: {income_level}"
+    variable = f"PLANS DATA:\n{context}\n\nQuestion: {question}"
+    user_prompt = profile_block + "\n\n" + variable
+
+    cache = st.session_state.setdefault("_answer_cache", {})
+    key = hashlib.sha256((STATIC_SYSTEM + user_prompt).encode()).hexdigest()
+    if key in cache:
+        st.markdown(cache[key])
+        return cache[key]
+
+    try:
+        stream = client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
+            messages=[
+                {"role": "system", "content": STATIC_SYSTEM},
+                {"role": "user", "content": user_prompt},
+            ],
             temperature=0.5,
             max_tokens=750,
+            stream=True,
         )
 
-        text = response.choices[0].message.content.strip()
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        def gen():
+            # Collapse runs of 3+ newlines as chunks arrive, so the collected
+            # text needs no extra normalization pass afterwards
+            run = 0
+            for chunk in stream:
+                piece = chunk.choices[0].delta.content or ""
+                if not piece:
+                    continue
+                out = []
+                for ch in piece:
+                    if ch == "\n":
+                        run += 1
+                        if run <= 2:
+                            out.append(ch)
+                    else:
+                        run = 0
+                        out.append(ch)
+                yield "".join(out)
+
+        text = (st.write_stream(gen) or "").strip()
+        cache[key] = text
         return text
 
     except OpenAIError as e:
         print(f"⚠️ API Error: {e}")
-        return build_local_summary(df, region, income_level, family_size)
+        text = build_local_summary(df, region, income_level, family_size)
+        st.markdown(text)
+        return text
+
+
+def ask_openai_batch(df: pd.DataFrame, questions: List[str], region: str,
+                     income_level: str, family_size: int) -> List[str]:
+    """Answer several questions over the same quotes in ONE API call.
+
+    Packing K questions into a single prompt amortizes the HTTP round-trip
+    and prompt prefill across all of them instead of paying it K times.
+    Returns one answer string per question, in input order.
+    """
+    if not questions:
+        return []
+    if not client:
+        return [build_local_summary(df, region, income_level, family_size) for _ in questions]
+
+    try:
+        context = df.to_dict(orient="records")
+        profile_block = f"Region: {region}\nFamily size: {family_size}\nIncome level: {income_level}"
+        numbered = "\n".join(f"{i + 1}. {q}" for i, q in enumerate(questions))
+        user_prompt = (
+            f"{profile_block}\n\nPLANS DATA:\n{context}\n\n"
+            f"Answer each numbered question below about these plans.\n{numbered}\n\n"
+            'Return ONLY a JSON object of the form '
+            '{"answers": [{"q": 1, "analysis": "...", "plan": "..."}, ...]} '
+            "with exactly one entry per question, in order."
+        )
+
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": STATIC_SYSTEM},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.5,
+            max_tokens=750 * len(questions),
+            response_format={"type": "json_object"},
+        )
+        raw = response.choices[0].message.content
+
+        # Tolerant parse: full JSON first, then the bracketed answers region
+        try:
+            answers = json.loads(raw).get("answers", [])
+        except json.JSONDecodeError:
+            m = re.search(r"\[.*\]", raw, flags=re.DOTALL)
+            answers = json.loads(m.group(0)) if m else []
+
+        by_index = {int(a.get("q", i + 1)): a for i, a in enumerate(answers)}
+        results = []
+        for i in range(len(questions)):
+            a = by_index.get(i + 1)
+            if a:
+                results.append(f"### 🧠 Analysis\n{a.get('analysis', '')}\n\n"
+                               f"### 🏆 Recommended Plan\n**{a.get('plan', 'N/A')}**")
+            else:
+                results.append(build_local_summary(df, region, income_level, family_size))
+        return results
+
+    except (OpenAIError, ValueError) as e:
+        print(f"⚠️ API Error: {e}")
+        return [build_local_summary(df, region, income_level, family_size) for _ in questions]
 
 # ==============================================================
 # Run Analysis and Display
 # ==============================================================
 if user_question and quotes:
-    ranked = score_quotes(quotes, int(expected_claims), float(avg_claim), weights)
-    with st.spinner("Analyzing with context awareness..."):
-        answer = ask_openai_context(ranked, user_question, region, income_level, fam_size)
+    ranked = _cached_score(tuple(astuple(q) for q in quotes), int(expected_claims),
+                           float(avg_claim), tuple(sorted(weights.items())))
 
-    # Markdown formatting fix for long outputs
+    # Markdown formatting fix for long outputs (injected before streaming)
     st.markdown(
         """
         <style>
@@ -208,7 +344,8 @@ if user_question and quotes:
         unsafe_allow_html=True,
     )
 
-    st.markdown(answer)
+    with st.spinner("Analyzing with context awareness..."):
+        answer = ask_openai_context(ranked, user_question, region, income_level, fam_size)
 
 elif user_question and not quotes:
     st.warning("Please upload or enter at least one quote before asking a question.")
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -18,6 +19,22 @@ if not api_key:
 client = OpenAI(api_key=api_key)
 
 
+@lru_cache(maxsize=64)
+def _cached_completion(system_prompt: str, user_prompt: str) -> str:
+    """Memoize completions on the exact prompt pair so re-asking about the
+    same ranked quotes skips the API round-trip."""
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        temperature=0.7,
+        max_tokens=300,
+    )
+    return response.choices[0].message.content
+
+
 def explain_choice_llm(df_ranked, family_desc: str) -> str:
     """Uses prompt-engineered LLM for human-like explanation."""
     if df_ranked.empty:
@@ -37,14 +54,4 @@ def explain_choice_llm(df_ranked, family_desc: str) -> str:
         "and the trade-offs between them in simple language."
     )
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.7,
-        max_tokens=300,
-    )
-
-    return response.choices[0].message.content
+    return _cached_completion(system_prompt, user_prompt)
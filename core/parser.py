@@ -16,7 +16,15 @@ RENAME_MAP = {
     'network_size': 'network_size', 'network': 'network_size'
 }
 
+# Quote field order; defaults applied when a column is missing or a cell is blank
+NUMERIC_DEFAULTS = {
+    'premium': 0.0, 'deductible': 0.0, 'coinsurance': 0.2,
+    'out_of_pocket_max': 0.0, 'coverage_limit': None,
+    'annual_benefit_max': None, 'network_size': None,
+}
+
 def _safe_float(x, default=0.0):
+    """Scalar fallback; bulk parsing coerces whole columns via pd.to_numeric."""
     try:
         if pd.isna(x) or x is None or x == "":
             return default
@@ -26,19 +34,25 @@ def _safe_float(x, default=0.0):
 
 def read_quotes_from_df(df: pd.DataFrame) -> List[Quote]:
     df = df.rename(columns={c: RENAME_MAP.get(c.lower().strip(), c) for c in df.columns})
-    quotes = []
-    for _, row in df.iterrows():
-        quotes.append(Quote(
-            plan_name=str(row.get('plan_name', f"Plan {_+1}")),
-            premium=_safe_float(row.get('premium')),
-            deductible=_safe_float(row.get('deductible')),
-            coinsurance=_safe_float(row.get('coinsurance'), 0.2),
-            out_of_pocket_max=_safe_float(row.get('out_of_pocket_max')),
-            coverage_limit=_safe_float(row.get('coverage_limit'), None),
-            annual_benefit_max=_safe_float(row.get('annual_benefit_max'), None),
-            network_size=_safe_float(row.get('network_size'), None),
-        ))
-    return quotes
+    # Columnar build: pull each column out once instead of boxing every row
+    # through iterrows
+    if 'plan_name' in df.columns:
+        names = df['plan_name'].astype(str).tolist()
+    else:
+        names = [f"Plan {i+1}" for i in range(len(df))]
+    df = df.reindex(columns=list(NUMERIC_DEFAULTS))
+    # Whole-column coercion: one str.replace + to_numeric per column instead
+    # of a Python-level _safe_float call per cell
+    columns = []
+    for col, default in NUMERIC_DEFAULTS.items():
+        s = pd.to_numeric(df[col].astype("string").str.replace(",", "", regex=False),
+                          errors="coerce")
+        if default is None:
+            values = s.astype(object).where(s.notna(), None).tolist()
+        else:
+            values = s.fillna(default).tolist()
+        columns.append(values)
+    return [Quote(*row) for row in zip(names, *columns)]
 
 def read_uploaded_file(uploaded_file) -> List[Quote]:
     name = uploaded_file.name.lower()
@@ -1,31 +1,60 @@
 from typing import List, Tuple
 import json
 from pathlib import Path
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
 
 class LocalRAG:
     """Tiny TF-IDF retriever over a local glossary (no external API)."""
 
     def __init__(self, glossary_path: str | Path, ngram_range=(1, 2)):
+        # Deferred: sklearn imports dozens of submodules and would otherwise
+        # land on the app's cold-start path even when RAG is never used
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         self.terms: List[str] = []
         self.passages: List[str] = []
-        self.vectorizer = TfidfVectorizer(ngram_range=ngram_range, stop_words="english")
+        # float32 halves memory and bandwidth for the similarity products
+        self.vectorizer = TfidfVectorizer(ngram_range=ngram_range, stop_words="english",
+                                          dtype=np.float32)
         self._fit(glossary_path)
 
     def _fit(self, path: str | Path):
-        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        import joblib
+
+        path = Path(path)
+        # Glossary is static, so the fitted vectorizer is persisted next to it
+        # and reloaded on warm starts instead of refitting every boot
+        cache = path.with_suffix(".tfidf.joblib")
+        if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+            try:
+                self.vectorizer, self.doc_matrix, self.terms, self.passages = joblib.load(cache)
+                return
+            except Exception:
+                pass  # stale/corrupt cache: fall through and refit
+
+        data = json.loads(path.read_text(encoding="utf-8"))
         # data is list of {"term": "...", "definition": "..."}
         self.terms = [d["term"] for d in data]
         self.passages = [d["definition"] for d in data]
         self.doc_matrix = self.vectorizer.fit_transform(self.passages)
+        try:
+            joblib.dump((self.vectorizer, self.doc_matrix, self.terms, self.passages), cache)
+        except OSError:
+            pass  # read-only deployment: caching is best-effort
 
     def retrieve(self, query: str, k: int = 2) -> List[Tuple[str, str]]:
         if not query or not query.strip():
             return []
         q = self.vectorizer.transform([query])
-        sims = cosine_similarity(q, self.doc_matrix)[0]
-        idxs = sims.argsort()[::-1][:k]
+        # Rows are already L2-normalized by TfidfVectorizer, so the plain dot
+        # product IS the cosine similarity (no sklearn re-normalization)
+        sims = (q @ self.doc_matrix.T).toarray().ravel()
+        k = min(k, len(sims))
+        if k <= 0:
+            return []
+        # argpartition selects top-k in O(N); only those k get sorted
+        idxs = np.argpartition(-sims, k - 1)[:k]
+        idxs = idxs[np.argsort(-sims[idxs])]
         return [(self.terms[i], self.passages[i]) for i in idxs]
 
     def answer(self, query: str, k: int = 2) -> str:
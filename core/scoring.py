@@ -1,9 +1,11 @@
 # core/scoring.py
 from typing import Dict, List
+import numpy as np
 import pandas as pd
 from .models import Quote
 
 def expected_cost(q: Quote, expected_claims: int, avg_claim_amount: float) -> float:
+    """Expected annual cost for a single quote (kept for one-off use)."""
     premium = q.premium or 0.0
     deductible = q.deductible or 0.0
     coins = q.coinsurance or 0.0
@@ -11,40 +13,57 @@ def expected_cost(q: Quote, expected_claims: int, avg_claim_amount: float) -> fl
     per_claim = deductible + coins * max(0.0, avg_claim_amount - deductible)
     return premium + min(expected_claims * per_claim, oop)
 
+def _field_array(quotes: List[Quote], attr: str) -> np.ndarray:
+    return np.fromiter(
+        ((getattr(q, attr) or 0.0) for q in quotes),
+        dtype=np.float64, count=len(quotes),
+    )
+
 def score_quotes(quotes: List[Quote], expected_claims: int, avg_claim_amount: float,
                  weights: Dict[str, float] | None = None) -> pd.DataFrame:
     if weights is None:
         weights = {"cost": 0.6, "coverage": 0.3, "network": 0.1}
 
-    max_network = max([q.network_size or 0 for q in quotes]) or 1
-    max_coverage = max([(q.coverage_limit or 0) + (q.annual_benefit_max or 0) for q in quotes]) or 1
-
-    rows = []
-    for q in quotes:
-        exp_cost = expected_cost(q, expected_claims, avg_claim_amount)
-        cost_score = 1 / (1 + exp_cost / 100000)
-        coverage_score = ((q.coverage_limit or q.annual_benefit_max or 0) / max_coverage)
-        network_score = (q.network_size or 0) / max_network
-
-        composite = (weights["cost"] * cost_score +
-                     weights["coverage"] * coverage_score +
-                     weights["network"] * network_score)
-
-        rows.append({
-            "plan_name": q.plan_name,
-            "expected_annual_cost": round(exp_cost, 2),
-            "cost_score": round(cost_score, 3),
-            "coverage_score": round(coverage_score, 3),
-            "network_score": round(network_score, 3),
-            "composite_score": round(composite, 3),
-            "premium": q.premium,
-            "deductible": q.deductible,
-            "coinsurance": q.coinsurance,
-            "out_of_pocket_max": q.out_of_pocket_max,
-            "coverage_limit": q.coverage_limit,
-            "annual_benefit_max": q.annual_benefit_max,
-            "network_size": q.network_size,
-        })
-
-    df = pd.DataFrame(rows)
+    premium = _field_array(quotes, "premium")
+    deductible = _field_array(quotes, "deductible")
+    coins = _field_array(quotes, "coinsurance")
+    oop = _field_array(quotes, "out_of_pocket_max")
+    cov_lim = _field_array(quotes, "coverage_limit")
+    abm = _field_array(quotes, "annual_benefit_max")
+    net = _field_array(quotes, "network_size")
+
+    # Normalizers come straight off the arrays already materialized above:
+    # no extra passes over the quotes list, and negative junk values are
+    # clamped out of the coverage ceiling
+    cov_sum = np.maximum(cov_lim, 0) + np.maximum(abm, 0)
+    max_coverage = max(cov_sum.max(), 1)
+    max_network = max(net.max(), 1)
+
+    per_claim = deductible + coins * np.maximum(0.0, avg_claim_amount - deductible)
+    oop_eff = np.where(oop > 0, oop, deductible + coins * avg_claim_amount)
+    exp_cost = premium + np.minimum(expected_claims * per_claim, oop_eff)
+
+    cost_score = 1 / (1 + exp_cost / 100000)
+    coverage_score = np.where(cov_lim > 0, cov_lim, abm) / max_coverage
+    network_score = net / max_network
+
+    composite = (weights["cost"] * cost_score +
+                 weights["coverage"] * coverage_score +
+                 weights["network"] * network_score)
+
+    df = pd.DataFrame({
+        "plan_name": [q.plan_name for q in quotes],
+        "expected_annual_cost": exp_cost.round(2),
+        "cost_score": cost_score.round(3),
+        "coverage_score": coverage_score.round(3),
+        "network_score": network_score.round(3),
+        "composite_score": composite.round(3),
+        "premium": [q.premium for q in quotes],
+        "deductible": [q.deductible for q in quotes],
+        "coinsurance": [q.coinsurance for q in quotes],
+        "out_of_pocket_max": [q.out_of_pocket_max for q in quotes],
+        "coverage_limit": [q.coverage_limit for q in quotes],
+        "annual_benefit_max": [q.annual_benefit_max for q in quotes],
+        "network_size": [q.network_size for q in quotes],
+    })
     return df.sort_values(by="composite_score", ascending=False)
@@ -1,8 +1,10 @@
 import pandas as pd
 
 def df_to_markdown(df: pd.DataFrame) -> str:
+    # Stringify all cells in one vectorized pass instead of boxing rows
+    # through iterrows
+    cells = df.astype(str).fillna("nan").to_numpy()
     lines = ["| " + " | ".join(df.columns) + " |",
              "| " + " | ".join(["---"] * len(df.columns)) + " |"]
-    for _, row in df.iterrows():
-        lines.append("| " + " | ".join(str(x) for x in row.values) + " |")
+    lines.extend("| " + " | ".join(row) + " |" for row in cells)
     return "\n".join(lines)